@@ -8,15 +8,18 @@ Requirements:
 - scrcpy 3.x installed and in PATH
 - Python 3.11+ (for MYScrcpy)
 - pip install mysc adbutils pillow numpy
+- Optional: pip install "screen-buffer-mcp[fast]" - simplejpeg (libjpeg-turbo
+  JPEG encoding) and opencv-python-headless (fast PNG encoding and resizing)
 """
 
 import asyncio
 import io
 import logging
-import subprocess
+import os
 import threading
 import time
-from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -24,12 +27,54 @@ logger = logging.getLogger("screen-buffer-mcp.scrcpy")
 
 # Frame buffer size
 FRAME_BUFFER_SIZE = 10
+# Ring slots - one spare so the producer never writes a readable slot
+RING_SLOTS = FRAME_BUFFER_SIZE + 1
+# Attempts to read a ring slot before giving up (only retried if lapped)
+RING_READ_RETRIES = 3
+# Target capture rate - frames arriving faster than this are not buffered
+FRAME_BUFFER_FPS = 60
+FRAME_INTERVAL = 1.0 / FRAME_BUFFER_FPS
+# Minimum gap between buffered frames (with slack for polling jitter)
+MIN_FRAME_GAP_NS = int(FRAME_INTERVAL * 0.75 * 1_000_000_000)
+# Poll faster than the frame rate so a new frame is picked up within ~8ms
+POLL_INTERVAL = 0.008
+# How long a screenshot waits for the first frame when the buffer is empty
+FRAME_WAIT_TIMEOUT = 0.1
+# How long connect() waits for the video stream to come up, and how often it checks
+SESSION_START_TIMEOUT = 2.0
+SESSION_POLL_INTERVAL = 0.02
+# How long connect() waits for the first frame to arrive
+FIRST_FRAME_TIMEOUT = 2.0
+# Pre-encoding stops when no JPEG screenshot was requested for this long
+PREENCODE_IDLE_TIMEOUT = 2.0
+# Worker threads for blocking scrcpy work (connect, frame waits, encoding)
+DEFAULT_EXECUTOR_WORKERS = 8
+
+
+def _executor_workers() -> int:
+    """Pool size from SCREEN_BUFFER_POOL_SIZE, or the default if unset/invalid."""
+    raw = os.environ.get("SCREEN_BUFFER_POOL_SIZE")
+    if not raw:
+        return DEFAULT_EXECUTOR_WORKERS
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning(
+            f"Ignoring SCREEN_BUFFER_POOL_SIZE={raw!r}: expected a positive integer, "
+            f"using {DEFAULT_EXECUTOR_WORKERS}"
+        )
+        return DEFAULT_EXECUTOR_WORKERS
+    return workers
+
+
+EXECUTOR_WORKERS = _executor_workers()
 
 # Try to import MYScrcpy
 try:
     from adbutils import adb
     from myscrcpy.core import Session, VideoArgs
-    from PIL import Image
     import numpy as np
     MYSCRCPY_AVAILABLE = True
 except ImportError:
@@ -37,26 +82,192 @@ except ImportError:
     adb = None
     Session = None
     VideoArgs = None
-    Image = None
     np = None
 
+# Optional fast JPEG encoder (libjpeg-turbo)
+try:
+    import simplejpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+    simplejpeg = None
+
+# Optional fast PNG/JPEG encoder and resizer (OpenCV calls libpng/libjpeg directly)
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+    cv2 = None
+
+# Supported screenshot encodings ("raw" = uncompressed .npy array)
+IMAGE_FORMATS = ("jpeg", "png", "raw")
+JPEG_QUALITY = 85
+# Screenshots are transient payloads - favor encode speed over size
+PNG_COMPRESSION = 1
+
+# Per-thread reusable buffer for the Pillow fallback encoder
+_encode_local = threading.local()
+
+
+def _get_encode_buffer() -> io.BytesIO:
+    """Get this thread's encode buffer, emptied for reuse."""
+    buffer = getattr(_encode_local, "buffer", None)
+    if buffer is None:
+        buffer = _encode_local.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+def _encode_frame(frame: "np.ndarray", fmt: str = "jpeg") -> bytes:
+    """Encode an RGB frame (HxWx3 uint8) to image bytes.
+
+    Encoders take the numpy frame directly. Preference order is simplejpeg
+    (JPEG only), then OpenCV, then Pillow as a last resort. "raw" skips
+    compression entirely and returns the pixels as a .npy file, whose header
+    records shape and dtype (load with np.load(io.BytesIO(data))).
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {fmt}")
+
+    if fmt == "raw":
+        # Header + pixels joined directly: one copy, and no multi-MB array left
+        # behind in a reusable per-thread buffer
+        frame = np.ascontiguousarray(frame)
+        header = io.BytesIO()
+        np.lib.format.write_array_header_1_0(header, np.lib.format.header_data_from_array_1_0(frame))
+        return b"".join((header.getvalue(), frame.data))
+
+    if fmt == "jpeg" and SIMPLEJPEG_AVAILABLE:
+        # MYScrcpy frames are RGB; simplejpeg only copies if not C-contiguous
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(frame),
+            quality=JPEG_QUALITY,
+            colorspace="RGB",
+            fastdct=True,
+        )
+
+    if OPENCV_AVAILABLE:
+        # OpenCV expects BGR channel order
+        bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        if fmt == "jpeg":
+            ok, encoded = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        else:
+            ok, encoded = cv2.imencode(".png", bgr, [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION])
+        if not ok:
+            raise RuntimeError(f"{fmt.upper()} encoding failed")
+        return encoded.tobytes()
+
+    from PIL import Image
+
+    img = Image.fromarray(frame)
+    buffer = _get_encode_buffer()
+    if fmt == "jpeg":
+        img.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+    else:
+        img.save(buffer, format="PNG", compress_level=PNG_COMPRESSION)
+    return buffer.getvalue()
+
+
+def _resize_frame(frame: "np.ndarray", max_dim: int) -> "np.ndarray":
+    """Downscale a frame so its longest side is at most max_dim pixels."""
+    height, width = frame.shape[0], frame.shape[1]
+    longest = max(height, width)
+    if longest <= max_dim:
+        return frame
+
+    scale = max_dim / longest
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    if OPENCV_AVAILABLE:
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    from PIL import Image
+
+    return np.asarray(Image.fromarray(frame).resize(size, Image.Resampling.BOX))
+
+
+def _encode_scaled(frame: "np.ndarray", fmt: str, max_dim: int | None) -> bytes:
+    """Optionally downscale a frame, then encode it."""
+    if max_dim:
+        frame = _resize_frame(frame, max_dim)
+    return _encode_frame(frame, fmt)
+
 
 class ScrcpyBackend:
     """Fast screenshots using MYScrcpy (scrcpy 3.x) frame buffer."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        screenshot_max_dim: int | None = None,
+        encode_fps: float | None = None,
+        is_safe_to_share: bool = True,
+    ):
+        """
+        Args:
+            screenshot_max_dim: If set, buffered frames are downscaled so their
+                longest side is at most this many pixels. Screenshots use the
+                downscaled frames; get_screen_size() still reports native size.
+            encode_fps: If set, the polling thread JPEG-encodes the newest frame
+                at up to this rate while JPEG screenshots are being requested.
+                screenshot(fmt="jpeg") returns those cached bytes when they are
+                of the newest buffered frame, and encodes on demand otherwise.
+            is_safe_to_share: Whether frames from get_frame() can be kept by
+                reference. MYScrcpy's get_frame() returns the decoder's last
+                frame - the same object until the next frame is decoded, which
+                replaces it rather than writing into it - so the latest native
+                frame is shared with get_latest_frame_view(). Set False if the
+                source may reuse its frame memory; each frame is then copied
+                first. (The ring buffer always holds its own copy.)
+        """
+        self._screenshot_max_dim = screenshot_max_dim
+        self._encode_fps = encode_fps
+        self._is_safe_to_share = is_safe_to_share
         self._session: "Session | None" = None
         self._device_id: str | None = None
         self._connected = False
         self._width = 0
         self._height = 0
-        # Circular buffer of last N frames
-        self._frame_buffer: deque = deque(maxlen=FRAME_BUFFER_SIZE)
-        self._lock = threading.Lock()
+        # Lock-free single-producer ring of the last N frames. Published as one
+        # tuple (frames, timestamps, base_seq) so readers see a consistent ring:
+        # frames is (RING_SLOTS, H, W, 3), timestamps (RING_SLOTS,), and base_seq
+        # the _seq value when the ring was allocated. A ring is only published
+        # once frame base_seq is written into it, so it is never empty.
+        self._ring: "tuple[np.ndarray, np.ndarray, int] | None" = None
+        # Frames written so far. Frame k lives in slot k % RING_SLOTS; the
+        # producer bumps _seq only after the slot is fully written, and readers
+        # re-check it after copying (seqlock-style) to detect being lapped.
+        # Plain int stores/loads are atomic under the GIL.
+        self._seq = 0
+        # Latest native-size frame (may be larger than the ring's frames)
+        self._latest_raw: "np.ndarray | None" = None
+        # Buffer stats published by the polling thread (single writer) so
+        # get_buffer_info() can read them without coordination
+        self._frame_count = 0
+        # Frame timestamps are time.monotonic_ns() values
+        self._oldest_ts: int | None = None
+        self._newest_ts: int | None = None
+        # Signalled by the polling thread when the first frame is buffered
+        self._frame_ready = threading.Condition()
+        # Set (via the event loop) when the first frame of a connection lands
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._first_frame_event: asyncio.Event | None = None
         self._frame_thread: threading.Thread | None = None
         self._running = False
+        # Set on disconnect to wake the polling thread immediately
+        self._stop_event = threading.Event()
+        # Recent encodes keyed by (frame timestamp, fmt, max_dim), least recently used first
+        self._encoded_frames: OrderedDict[tuple[int, str, int | None], bytes] = OrderedDict()
+        # Producer-side JPEG cache: (frame timestamp, bytes), published atomically
+        self._latest_jpeg: tuple[int, bytes] | None = None
+        self._last_jpeg_request = 0.0
+        # Newest buffered frame not yet pre-encoded: (frame, timestamp)
+        self._jpeg_pending: "tuple[np.ndarray, int] | None" = None
+        self._last_jpeg_encode = 0  # time.monotonic_ns() of the last pre-encode
+        # Private pool so scrcpy work doesn't compete with the loop's default executor
+        self._executor: ThreadPoolExecutor | None = None
         # Recording state (uses separate scrcpy process with --record)
-        self._recording_process: subprocess.Popen | None = None
+        self._recording_process: asyncio.subprocess.Process | None = None
         self._recording_output_path: str | None = None
         self._recording_start_time: float | None = None
 
@@ -67,24 +278,130 @@ class ScrcpyBackend:
 
     def _frame_polling_loop(self) -> None:
         """Continuously poll for new frames and add to buffer."""
+        last_append = 0
+        last_frame = None
+        next_poll = time.monotonic()
         while self._running and self._session is not None:
             try:
                 if self._session.va is not None:
                     frame = self._session.va.get_frame()
-                    if frame is not None:
-                        current_time = time.time()
-                        with self._lock:
-                            self._frame_buffer.append({
-                                'frame': frame,
-                                'timestamp': current_time
-                            })
-                            if self._height == 0:
-                                self._height, self._width = frame.shape[:2]
-
-                time.sleep(0.016)  # ~60 fps polling
+                    current_time = time.monotonic_ns()
+                    # get_frame() returns the latest decoded frame; the same object
+                    # again means nothing new arrived, so don't buffer a duplicate
+                    if (frame is not None and frame is not last_frame
+                            and current_time - last_append >= MIN_FRAME_GAP_NS):
+                        last_append = current_time
+                        last_frame = frame
+                        if not self._is_safe_to_share:
+                            frame = frame.copy()
+                        # Downscale once here so every screenshot encodes fewer pixels
+                        scaled = frame
+                        if self._screenshot_max_dim:
+                            scaled = _resize_frame(frame, self._screenshot_max_dim)
+                        self._store_frame(scaled, current_time)
+                        is_first = self._latest_raw is None
+                        self._latest_raw = frame
+                        # Track the native size; it changes when the device rotates
+                        if (frame.shape[0], frame.shape[1]) != (self._height, self._width):
+                            self._height, self._width = frame.shape[0], frame.shape[1]
+                        if is_first:
+                            with self._frame_ready:
+                                self._frame_ready.notify_all()
+                            if self._loop is not None and self._first_frame_event is not None:
+                                self._loop.call_soon_threadsafe(self._first_frame_event.set)
+                        if self._encode_fps:
+                            self._jpeg_pending = (scaled, current_time)
+                    # Checked every tick, not just on new frames, so a frame that
+                    # arrived inside the throttle window is still encoded later
+                    if self._jpeg_pending is not None:
+                        self._preencode()
+
+                # MYScrcpy has no frame callback or blocking get_frame(), so poll
+                # at ~2x the frame rate; waiting on the stop event lets disconnect()
+                # wake us. Ticks follow a fixed deadline so per-poll work doesn't
+                # drift the cadence; missed ticks are skipped, not run back-to-back.
+                next_poll += POLL_INTERVAL
+                delay = next_poll - time.monotonic()
+                if delay < 0:
+                    next_poll = time.monotonic()
+                    delay = 0
+                self._stop_event.wait(delay)
             except Exception as e:
                 logger.debug(f"Frame polling error: {e}")
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
+                next_poll = time.monotonic()
+
+    def _store_frame(self, frame: "np.ndarray", timestamp: int) -> None:
+        """Copy a frame into the next ring slot (polling thread only).
+
+        The ring is (re)allocated on the first frame and whenever the frame
+        shape changes (e.g. rotation), which drops older frames.
+        """
+        ring = self._ring
+        seq = self._seq
+        slot = seq % RING_SLOTS
+        if ring is None or ring[0].shape[1:] != frame.shape:
+            frames = np.empty((RING_SLOTS, *frame.shape), dtype=frame.dtype)
+            timestamps = np.zeros(RING_SLOTS, dtype=np.int64)
+            np.copyto(frames[slot], frame)
+            timestamps[slot] = timestamp
+            # Publish the ring with its first frame already in place; readers
+            # that see it before _seq is bumped still find that frame
+            ring = (frames, timestamps, seq)
+            self._ring = ring
+        else:
+            frames, timestamps, _ = ring
+            np.copyto(frames[slot], frame)
+            timestamps[slot] = timestamp
+        base_seq = ring[2]
+        # Publish only once the slot is fully written (and after the ring)
+        self._seq = seq + 1
+
+        count = min(seq + 1 - base_seq, FRAME_BUFFER_SIZE)
+        self._oldest_ts = int(timestamps[(seq + 1 - count) % RING_SLOTS])
+        self._newest_ts = timestamp
+        self._frame_count = count
+
+    def _buffered_count(self) -> int:
+        """Number of readable frames in the ring."""
+        ring = self._ring
+        if ring is None:
+            return 0
+        return min(max(self._seq - ring[2], 1), FRAME_BUFFER_SIZE)
+
+    def _preencode(self) -> None:
+        """JPEG-encode the pending frame on the producer side (throttled, lazy)."""
+        if time.monotonic() - self._last_jpeg_request > PREENCODE_IDLE_TIMEOUT:
+            # Nobody is asking - don't spend CPU; the frame stays pending
+            self._latest_jpeg = None
+            return
+        now = time.monotonic_ns()
+        if self._latest_jpeg is not None and now - self._last_jpeg_encode < 1_000_000_000 / self._encode_fps:
+            return
+        frame, timestamp = self._jpeg_pending
+        self._jpeg_pending = None
+        self._last_jpeg_encode = now
+        self._latest_jpeg = (timestamp, _encode_frame(frame, "jpeg"))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the backend's worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_WORKERS,
+                thread_name_prefix="scrcpy",
+            )
+        return self._executor
+
+    def _wait_for_frame(self, timeout: float) -> bool:
+        """Block until at least one frame is buffered. Returns False on timeout."""
+        with self._frame_ready:
+            return self._frame_ready.wait_for(lambda: self._buffered_count() > 0, timeout)
+
+    async def _ensure_frame(self) -> None:
+        """Wait briefly for the first frame instead of failing on an empty buffer."""
+        if self._buffered_count() == 0:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(self._get_executor(), self._wait_for_frame, FRAME_WAIT_TIMEOUT)
 
     async def connect(self, device_id: str | None = None) -> bool:
         """Connect to device via scrcpy video stream. Returns True if successful."""
@@ -103,12 +420,8 @@ class ScrcpyBackend:
                 return False
 
             # Find requested device or use first
-            device = None
             if device_id:
-                for d in devices:
-                    if d.serial == device_id:
-                        device = d
-                        break
+                device = {d.serial: d for d in devices}.get(device_id)
                 if not device:
                     logger.warning(f"Device {device_id} not found")
                     return False
@@ -124,22 +437,32 @@ class ScrcpyBackend:
             def _connect():
                 self._session = Session(
                     device,
-                    video_args=VideoArgs(fps=60),
+                    video_args=VideoArgs(fps=FRAME_BUFFER_FPS),
                     control_args=None  # No control needed - just video stream
                 )
-                # Wait for connection
-                time.sleep(1)
+                # Wait for the video stream, returning as soon as it is up
+                deadline = time.monotonic() + SESSION_START_TIMEOUT
+                while time.monotonic() < deadline:
+                    if self._session.va is not None:
+                        return True
+                    time.sleep(SESSION_POLL_INTERVAL)
                 return self._session.va is not None
 
-            connected = await loop.run_in_executor(None, _connect)
+            connected = await loop.run_in_executor(self._get_executor(), _connect)
 
             if connected:
                 self._connected = True
                 self._running = True
+                self._stop_event.clear()
+                self._loop = asyncio.get_running_loop()
+                self._first_frame_event = asyncio.Event()
                 self._frame_thread = threading.Thread(target=self._frame_polling_loop, daemon=True)
                 self._frame_thread.start()
-                # Wait for first frame
-                await asyncio.sleep(0.5)
+                # Wait for first frame (returns as soon as it lands)
+                try:
+                    await asyncio.wait_for(self._first_frame_event.wait(), timeout=FIRST_FRAME_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("No frame received yet from scrcpy")
                 logger.info(f"scrcpy connected to {self._device_id}")
                 return True
             else:
@@ -150,60 +473,123 @@ class ScrcpyBackend:
             logger.warning(f"scrcpy connection error: {e}")
             return False
 
-    async def screenshot(self) -> bytes:
-        """Get latest screenshot from frame buffer. Returns PNG bytes."""
+    async def screenshot(self, fmt: str = "jpeg", max_dim: int | None = None) -> bytes:
+        """Get latest screenshot from frame buffer.
+
+        Args:
+            fmt: Image format - "jpeg" (default, much faster to encode), "png"
+                (lossless) or "raw" (uncompressed .npy pixels, no encode)
+            max_dim: If set, downscale so the longest side is at most this many
+                pixels before encoding
+
+        Returns:
+            Encoded image bytes
+        """
         if not self._connected or not self._session:
             raise RuntimeError("scrcpy not connected")
 
-        with self._lock:
-            if not self._frame_buffer:
-                raise RuntimeError("No frames available in buffer")
-            # Get most recent frame
-            latest = self._frame_buffer[-1]
-            frame = latest['frame']
+        if fmt == "jpeg" and max_dim is None and self._encode_fps:
+            self._last_jpeg_request = time.monotonic()
+            cached = self._latest_jpeg
+            # Only serve bytes of the newest frame - the last frame before the
+            # screen went still may have landed inside the throttle window
+            if cached is not None and cached[0] == self._newest_ts:
+                return cached[1]
 
-        # Convert numpy array to PNG bytes
-        img = Image.fromarray(frame)
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        return buffer.getvalue()
+        await self._ensure_frame()
+        return await self._encode_buffered(0, fmt, max_dim)
 
-    async def get_frame_at_offset(self, offset: int = 0) -> bytes:
+    async def get_frame_at_offset(
+        self, offset: int = 0, fmt: str = "jpeg", max_dim: int | None = None
+    ) -> bytes:
         """Get frame at offset from latest (0 = latest, 1 = previous, etc.).
 
-        Returns PNG bytes.
+        Returns encoded image bytes in the requested format ("jpeg", "png" or
+        "raw"), optionally downscaled to at most max_dim pixels on the longest side.
         """
         if not self._connected or not self._session:
             raise RuntimeError("scrcpy not connected")
 
-        with self._lock:
-            if not self._frame_buffer:
+        await self._ensure_frame()
+        return await self._encode_buffered(offset, fmt, max_dim)
+
+    async def _encode_buffered(self, offset: int, fmt: str, max_dim: int | None = None) -> bytes:
+        """Encode the frame at offset from latest, reusing results for repeat requests.
+
+        Encoding runs on the backend's pool so concurrent tool calls aren't
+        stalled behind it (libjpeg-turbo/libpng release the GIL).
+        """
+        for _ in range(RING_READ_RETRIES):
+            ring = self._ring
+            seq = self._seq
+            if ring is None:
                 raise RuntimeError("No frames available in buffer")
+            frames, timestamps, base_seq = ring
+            # A freshly published ring already holds frame base_seq, even if
+            # _seq hasn't caught up yet
+            seq = max(seq, base_seq + 1)
+
+            # Clamp offset to the buffered frames; negative offsets would index
+            # the spare slot or slots that were never written
+            count = min(seq - base_seq, FRAME_BUFFER_SIZE)
+            index = seq - 1 - min(max(offset, 0), count - 1)
+            slot = index % RING_SLOTS
+            key = (int(timestamps[slot]), fmt, max_dim)
+            data = self._encoded_frames.get(key)
+            # The slot is reused as the ring wraps - encode a private copy
+            frame = frames[slot].copy() if data is None else None
+
+            # Valid unless the producer began overwriting the slot meanwhile
+            # (it writes frame index + RING_SLOTS there) or replaced the ring
+            if self._seq < index + RING_SLOTS and self._ring is ring:
+                break
+        else:
+            raise RuntimeError("Frame buffer overrun while reading")
+
+        if data is not None:
+            self._encoded_frames.move_to_end(key)
+            return data
+
+        loop = asyncio.get_event_loop()
+        data = await loop.run_in_executor(self._get_executor(), _encode_scaled, frame, fmt, max_dim)
+        # Raw blobs are full-size pixel dumps with no encode cost to save - don't pin them
+        if fmt != "raw":
+            self._encoded_frames[key] = data
+            if len(self._encoded_frames) > FRAME_BUFFER_SIZE:
+                self._encoded_frames.popitem(last=False)
+        return data
+
+    def get_latest_frame_view(self) -> memoryview:
+        """Get the latest raw RGB frame (HxWx3 uint8, native size) without encoding.
+
+        The read-only view shares memory with the buffered frame, so callers
+        that can consume raw pixels avoid any copy or encode.
+        """
+        if not self._connected or not self._session:
+            raise RuntimeError("scrcpy not connected")
 
-            # Clamp offset to buffer size
-            offset = min(offset, len(self._frame_buffer) - 1)
-            # Get frame at offset from end
-            frame_data = self._frame_buffer[-(offset + 1)]
-            frame = frame_data['frame']
+        frame = self._latest_raw
+        if frame is None:
+            raise RuntimeError("No frames available in buffer")
 
-        # Convert numpy array to PNG bytes
-        img = Image.fromarray(frame)
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        return buffer.getvalue()
+        return memoryview(np.ascontiguousarray(frame)).toreadonly()
 
     def get_buffer_info(self) -> dict[str, Any]:
-        """Get info about current frame buffer state."""
-        with self._lock:
-            count = len(self._frame_buffer)
-            oldest_ts = self._frame_buffer[0]['timestamp'] if count > 0 else None
-            newest_ts = self._frame_buffer[-1]['timestamp'] if count > 0 else None
+        """Get info about current frame buffer state.
+
+        Best-effort snapshot: reads the stats published by the polling thread
+        without locking (each attribute read is atomic under the GIL).
+        """
+        count = self._frame_count
+        oldest_ts = self._oldest_ts
+        newest_ts = self._newest_ts
+        now = time.monotonic_ns()
 
         return {
             'frame_count': count,
             'buffer_size': FRAME_BUFFER_SIZE,
-            'oldest_frame_age_ms': int((time.time() - oldest_ts) * 1000) if oldest_ts else None,
-            'newest_frame_age_ms': int((time.time() - newest_ts) * 1000) if newest_ts else None,
+            'oldest_frame_age_ms': (now - oldest_ts) // 1_000_000 if oldest_ts is not None else None,
+            'newest_frame_age_ms': (now - newest_ts) // 1_000_000 if newest_ts is not None else None,
         }
 
     async def get_screen_size(self) -> tuple[int, int]:
@@ -218,7 +604,7 @@ class ScrcpyBackend:
     @property
     def is_recording(self) -> bool:
         """Check if recording is active."""
-        return self._recording_process is not None and self._recording_process.poll() is None
+        return self._recording_process is not None and self._recording_process.returncode is None
 
     async def start_recording(self, output_path: str) -> bool:
         """Start recording to file using scrcpy --record.
@@ -253,20 +639,20 @@ class ScrcpyBackend:
 
         try:
             logger.info(f"Starting recording to {output_path}")
-            self._recording_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
+            self._recording_process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
             self._recording_output_path = str(output_file)
-            self._recording_start_time = time.time()
+            self._recording_start_time = time.monotonic()
 
             # Give scrcpy a moment to start
             await asyncio.sleep(0.5)
 
-            if self._recording_process.poll() is not None:
-                # Process exited immediately - check error
-                stderr = self._recording_process.stderr.read().decode() if self._recording_process.stderr else ""
+            if self._recording_process.returncode is not None:
+                # Process exited immediately - check error (pipe is at EOF, won't block)
+                stderr = (await self._recording_process.stderr.read()).decode() if self._recording_process.stderr else ""
                 logger.error(f"scrcpy recording failed to start: {stderr}")
                 self._recording_process = None
                 self._recording_output_path = None
@@ -303,12 +689,12 @@ class ScrcpyBackend:
             self._recording_process.terminate()
             # Wait for process to finish (max 5 seconds)
             try:
-                self._recording_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+                await asyncio.wait_for(self._recording_process.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 self._recording_process.kill()
-                self._recording_process.wait()
+                await self._recording_process.wait()
 
-            duration = time.time() - start_time if start_time else 0
+            duration = time.monotonic() - start_time if start_time else 0
 
             # Check if file was created
             output_file = Path(output_path) if output_path else None
@@ -350,7 +736,7 @@ class ScrcpyBackend:
                 "is_recording": False,
             }
 
-        duration = time.time() - self._recording_start_time if self._recording_start_time else 0
+        duration = time.monotonic() - self._recording_start_time if self._recording_start_time else 0
         return {
             "is_recording": True,
             "output_path": self._recording_output_path,
@@ -359,11 +745,12 @@ class ScrcpyBackend:
 
     def disconnect(self) -> None:
         """Disconnect from device."""
-        # Stop recording if active
+        # Stop recording if active (SIGTERM lets scrcpy finalize the file on its
+        # own; the event loop reaps the process - use stop_recording() to await it)
         if self._recording_process is not None:
             try:
-                self._recording_process.terminate()
-                self._recording_process.wait(timeout=2)
+                if self._recording_process.returncode is None:
+                    self._recording_process.terminate()
             except Exception:
                 pass
             self._recording_process = None
@@ -371,6 +758,7 @@ class ScrcpyBackend:
             self._recording_start_time = None
 
         self._running = False
+        self._stop_event.set()
         if self._frame_thread:
             self._frame_thread.join(timeout=1)
         if self._session:
@@ -379,8 +767,18 @@ class ScrcpyBackend:
             except Exception:
                 pass
         self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         self._connected = False
         self._width = 0
         self._height = 0
-        self._frame_buffer.clear()
+        self._ring = None
+        self._latest_raw = None
+        self._encoded_frames.clear()
+        self._frame_count = 0
+        self._oldest_ts = None
+        self._newest_ts = None
+        self._latest_jpeg = None
+        self._jpeg_pending = None
         logger.info("Disconnected from scrcpy")
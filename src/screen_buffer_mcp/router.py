@@ -2,15 +2,62 @@
 """Device Router - provides fast screenshots via scrcpy frame buffer."""
 
 import logging
+import os
 import time
+from collections.abc import Callable
+from functools import cached_property
 from typing import Any
 
-from .backends.scrcpy import ScrcpyBackend
+from .backends.scrcpy import IMAGE_FORMATS, ScrcpyBackend
 from .backends.adb import AdbBackend
 
 logger = logging.getLogger("screen-buffer-mcp.router")
 
 
+def _positive_env(name: str, parse: Callable[[str], int | float]) -> int | float | None:
+    """Read an optional positive number from the environment.
+
+    Unset means None; anything unparseable or not positive is ignored with a
+    warning rather than failing server startup.
+    """
+    raw = os.environ.get(name)
+    if not raw:
+        return None
+    try:
+        value = parse(raw)
+    except ValueError:
+        value = None
+    if value is None or not value > 0:
+        logger.warning(f"Ignoring {name}={raw!r}: expected a positive number")
+        return None
+    return value
+
+
+# Optional cap on screenshot resolution (longest side, in pixels)
+SCREENSHOT_MAX_DIM = _positive_env("SCREEN_BUFFER_MAX_DIM", int)
+# Optional producer-side JPEG pre-encoding rate (frames per second)
+SCREENSHOT_ENCODE_FPS = _positive_env("SCREEN_BUFFER_ENCODE_FPS", float)
+# Raw frames are returned as base64 text; a native 1080x2400 frame would be
+# ~10 MB, so raw is downscaled to this size unless max_dim is given
+RAW_DEFAULT_MAX_DIM = 512
+
+
+def _resolve_image_args(fmt: str, max_dim: int | None) -> int | None:
+    """Validate screenshot arguments and return the max_dim to use.
+
+    Errors inside the scrcpy path are treated as "fall back to adb", so bad
+    input would otherwise silently turn into a full-size PNG. Raw frames are
+    capped at RAW_DEFAULT_MAX_DIM unless the caller asks for a size.
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {fmt}")
+    if max_dim is not None and (type(max_dim) is not int or max_dim < 1):
+        raise ValueError(f"max_dim must be a positive integer, got {max_dim!r}")
+    if fmt == "raw" and max_dim is None:
+        return RAW_DEFAULT_MAX_DIM
+    return max_dim
+
+
 class DeviceRouter:
     """Routes screenshot operations to scrcpy frame buffer.
 
@@ -19,26 +66,35 @@ class DeviceRouter:
     """
 
     def __init__(self):
-        self._scrcpy: ScrcpyBackend | None = None
-        self._adb: AdbBackend | None = None
         self._scrcpy_available: bool | None = None  # None = not checked yet
 
-    @property
+    # Backends are created on first access; cached_property then stores them in
+    # the instance __dict__, so later lookups skip the descriptor entirely.
+
+    @cached_property
     def scrcpy(self) -> ScrcpyBackend:
         """Get or create scrcpy backend."""
-        if self._scrcpy is None:
-            self._scrcpy = ScrcpyBackend()
-        return self._scrcpy
+        return ScrcpyBackend(
+            screenshot_max_dim=SCREENSHOT_MAX_DIM,
+            encode_fps=SCREENSHOT_ENCODE_FPS,
+        )
 
-    @property
+    @cached_property
     def adb(self) -> AdbBackend:
         """Get or create adb backend."""
-        if self._adb is None:
-            self._adb = AdbBackend()
-        return self._adb
+        return AdbBackend()
+
+    @property
+    def _scrcpy(self) -> ScrcpyBackend | None:
+        """The scrcpy backend if it has been created, without creating it."""
+        return self.__dict__.get("scrcpy")
 
     async def _check_scrcpy_available(self) -> bool:
-        """Check if scrcpy backend is available and connected."""
+        """Check if scrcpy backend is available and connected.
+
+        Callers read _scrcpy_available directly once it is set, skipping the
+        coroutine call on every screenshot.
+        """
         if self._scrcpy_available is None:
             try:
                 self._scrcpy_available = await self.scrcpy.connect()
@@ -61,28 +117,45 @@ class DeviceRouter:
             "primary_backend": "scrcpy" if self._scrcpy_available else "adb"
         }
 
-    async def screenshot(self, device: str | None = None) -> tuple[bytes, str]:
-        """Take a screenshot from frame buffer. Returns (image_data, backend_used)."""
-        if await self._check_scrcpy_available():
+    async def screenshot(
+        self, device: str | None = None, fmt: str = "jpeg", max_dim: int | None = None
+    ) -> tuple[bytes, str, str]:
+        """Take a screenshot from frame buffer.
+
+        Returns (image_data, backend_used, image_format). The adb fallback
+        always returns full-size PNG, whatever format/max_dim was requested.
+        """
+        max_dim = _resolve_image_args(fmt, max_dim)
+
+        available = self._scrcpy_available if self._scrcpy_available is not None else await self._check_scrcpy_available()
+        if available:
             try:
                 start = time.perf_counter()
-                data = await self.scrcpy.screenshot()
+                data = await self.scrcpy.screenshot(fmt, max_dim)
                 elapsed = (time.perf_counter() - start) * 1000
                 logger.debug(f"scrcpy screenshot from buffer: {elapsed:.1f}ms")
-                return data, "scrcpy"
+                return data, "scrcpy", fmt
             except Exception as e:
                 logger.warning(f"scrcpy screenshot failed, falling back to adb: {e}")
 
         # Fallback to adb
         data = await self.adb.screenshot(device)
-        return data, "adb"
+        return data, "adb", "png"
+
+    async def get_frame_at_offset(
+        self, offset: int = 0, device: str | None = None, fmt: str = "jpeg", max_dim: int | None = None
+    ) -> tuple[bytes, str, str]:
+        """Get frame at offset from buffer (0=latest, 1=previous, etc.).
+
+        Returns (image_data, backend_used, image_format).
+        """
+        max_dim = _resolve_image_args(fmt, max_dim)
 
-    async def get_frame_at_offset(self, offset: int = 0, device: str | None = None) -> tuple[bytes, str]:
-        """Get frame at offset from buffer (0=latest, 1=previous, etc.)."""
-        if await self._check_scrcpy_available():
+        available = self._scrcpy_available if self._scrcpy_available is not None else await self._check_scrcpy_available()
+        if available:
             try:
-                data = await self.scrcpy.get_frame_at_offset(offset)
-                return data, "scrcpy"
+                data = await self.scrcpy.get_frame_at_offset(offset, fmt, max_dim)
+                return data, "scrcpy", fmt
             except Exception as e:
                 logger.warning(f"scrcpy get_frame_at_offset failed: {e}")
                 # For offset > 0, no fallback possible
@@ -91,7 +164,7 @@ class DeviceRouter:
 
         # Fallback to adb for latest frame only
         data = await self.adb.screenshot(device)
-        return data, "adb"
+        return data, "adb", "png"
 
     async def list_devices(self) -> list[dict[str, Any]]:
         """List connected devices."""
@@ -99,7 +172,8 @@ class DeviceRouter:
 
     async def get_screen_size(self, device: str | None = None) -> tuple[int, int]:
         """Get screen size. Returns (width, height)."""
-        if await self._check_scrcpy_available():
+        available = self._scrcpy_available if self._scrcpy_available is not None else await self._check_scrcpy_available()
+        if available:
             try:
                 return await self.scrcpy.get_screen_size()
             except Exception as e:
@@ -118,7 +192,8 @@ class DeviceRouter:
         Returns:
             Dict with success status and any error message
         """
-        if not await self._check_scrcpy_available():
+        available = self._scrcpy_available if self._scrcpy_available is not None else await self._check_scrcpy_available()
+        if not available:
             return {
                 "success": False,
                 "error": "Recording requires scrcpy - not available",
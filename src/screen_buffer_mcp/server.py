@@ -5,6 +5,7 @@ import asyncio
 import base64
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from mcp.server import Server
@@ -32,201 +33,272 @@ def get_router() -> DeviceRouter:
     return router
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available device tools."""
+def _frame_content(image_data: bytes, image_format: str, message: str) -> list[TextContent | ImageContent]:
+    """Build the tool result for an encoded frame."""
+    # ImageContent.data must be str; base64 output is pure ASCII, and the
+    # ASCII codec is the cheapest bytes -> str conversion
+    data = base64.b64encode(image_data).decode("ascii")
+    if image_format == "raw":
+        # Raw pixels aren't a displayable image - return the .npy blob as text
+        return [
+            TextContent(
+                type="text",
+                text=json.dumps({"encoding": "npy", "data": data})
+            ),
+            TextContent(type="text", text=message)
+        ]
+
     return [
-        Tool(
-            name="device_screenshot",
-            description="Take a screenshot of the device screen. Returns base64-encoded PNG image. Uses scrcpy frame buffer for ~50ms latency when available, falls back to adb (~500ms).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device": {
-                        "type": "string",
-                        "description": "Device ID (optional, uses first available if not specified)"
-                    }
-                },
-                "required": []
-            }
+        ImageContent(
+            type="image",
+            data=data,
+            mimeType=f"image/{image_format}"
         ),
-        Tool(
-            name="device_get_frame",
-            description="Get a frame from the scrcpy buffer at specified offset. Offset 0 = latest frame, 1 = previous frame, etc. Buffer holds last 10 frames.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "offset": {
-                        "type": "integer",
-                        "description": "Frame offset from latest (0=latest, 1=previous, etc.)",
-                        "default": 0
-                    },
-                    "device": {
-                        "type": "string",
-                        "description": "Device ID (optional)"
-                    }
+        TextContent(type="text", text=message)
+    ]
+
+
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[Tool] = [
+    Tool(
+        name="device_screenshot",
+        description="Take a screenshot of the device screen. Returns base64-encoded JPEG image (PNG when falling back to adb). Uses scrcpy frame buffer for ~50ms latency when available, falls back to adb (~500ms).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "enum": ["jpeg", "png", "raw"],
+                    "description": "Image format: jpeg (fastest), png (lossless), or raw (uncompressed .npy pixels as base64 text, skips encoding; scrcpy only). Raw is large - width x height x 3 bytes plus a third for base64 - so it defaults to max_dim 512 (~0.5 MB); native size at 1080x2400 is ~10 MB",
+                    "default": "jpeg"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="device_list",
-            description="List all connected Android devices.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="device_screen_size",
-            description="Get the screen size of the device in pixels.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device": {"type": "string", "description": "Device ID (optional)"}
+                "max_dim": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Downscale so the longest side is at most this many pixels (optional, scrcpy only). Much faster and smaller for previews."
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="device_backend_status",
-            description="Get the current backend status showing scrcpy connection and frame buffer info.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="device_start_recording",
-            description="Start recording screen to a video file. Uses scrcpy --record for efficient H.264 encoding on device. Recording runs in background until stopped.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "output_path": {
-                        "type": "string",
-                        "description": "Path to output video file (should end in .mp4)"
-                    }
+                "device": {
+                    "type": "string",
+                    "description": "Device ID (optional, uses first available if not specified)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="device_get_frame",
+        description="Get a frame from the scrcpy buffer at specified offset. Offset 0 = latest frame, 1 = previous frame, etc. Buffer holds last 10 frames.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "offset": {
+                    "type": "integer",
+                    "description": "Frame offset from latest (0=latest, 1=previous, etc.)",
+                    "minimum": 0,
+                    "default": 0
                 },
-                "required": ["output_path"]
-            }
-        ),
-        Tool(
-            name="device_stop_recording",
-            description="Stop the current recording and finalize the video file. Returns recording info including duration and file size.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="device_recording_status",
-            description="Get the current recording status. Returns whether recording is active, output path, and duration.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+                "format": {
+                    "type": "string",
+                    "enum": ["jpeg", "png", "raw"],
+                    "description": "Image format: jpeg (fastest), png (lossless), or raw (uncompressed .npy pixels as base64 text, skips encoding; scrcpy only). Raw is large - width x height x 3 bytes plus a third for base64 - so it defaults to max_dim 512 (~0.5 MB); native size at 1080x2400 is ~10 MB",
+                    "default": "jpeg"
+                },
+                "max_dim": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Downscale so the longest side is at most this many pixels (optional, scrcpy only). Much faster and smaller for previews."
+                },
+                "device": {
+                    "type": "string",
+                    "description": "Device ID (optional)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="device_list",
+        description="List all connected Android devices.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="device_screen_size",
+        description="Get the screen size of the device in pixels.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device": {"type": "string", "description": "Device ID (optional)"}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="device_backend_status",
+        description="Get the current backend status showing scrcpy connection and frame buffer info.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="device_start_recording",
+        description="Start recording screen to a video file. Uses scrcpy --record for efficient H.264 encoding on device. Recording runs in background until stopped.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "output_path": {
+                    "type": "string",
+                    "description": "Path to output video file (should end in .mp4)"
+                }
+            },
+            "required": ["output_path"]
+        }
+    ),
+    Tool(
+        name="device_stop_recording",
+        description="Stop the current recording and finalize the video file. Returns recording info including duration and file size.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="device_recording_status",
+        description="Get the current recording status. Returns whether recording is active, output path, and duration.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
-    """Handle tool calls."""
-    r = get_router()
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available device tools."""
+    return _TOOLS
 
-    try:
-        if name == "device_screenshot":
-            device = arguments.get("device")
-            image_data, backend_used = await r.screenshot(device)
-
-            return [
-                ImageContent(
-                    type="image",
-                    data=base64.b64encode(image_data).decode("utf-8"),
-                    mimeType="image/png"
-                ),
-                TextContent(
-                    type="text",
-                    text=f"Screenshot captured via {backend_used}"
-                )
-            ]
-
-        elif name == "device_get_frame":
-            offset = arguments.get("offset", 0)
-            device = arguments.get("device")
-            image_data, backend_used = await r.get_frame_at_offset(offset, device)
-
-            return [
-                ImageContent(
-                    type="image",
-                    data=base64.b64encode(image_data).decode("utf-8"),
-                    mimeType="image/png"
-                ),
-                TextContent(
-                    type="text",
-                    text=f"Frame at offset {offset} captured via {backend_used}"
-                )
-            ]
-
-        elif name == "device_list":
-            devices = await r.list_devices()
-            return [TextContent(
-                type="text",
-                text=json.dumps(devices, indent=2)
-            )]
 
-        elif name == "device_screen_size":
-            device = arguments.get("device")
-            width, height = await r.get_screen_size(device)
-            return [TextContent(
-                type="text",
-                text=f"Screen size: {width}x{height}"
-            )]
+async def _handle_screenshot(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_screenshot: latest frame from the buffer (or adb)."""
+    device = arguments.get("device")
+    fmt = arguments.get("format", "jpeg")
+    max_dim = arguments.get("max_dim")
+    image_data, backend_used, image_format = await r.screenshot(device, fmt, max_dim)
 
-        elif name == "device_backend_status":
-            status = r.get_backend_status()
-            return [TextContent(
-                type="text",
-                text=json.dumps(status, indent=2)
-            )]
-
-        elif name == "device_start_recording":
-            output_path = arguments.get("output_path")
-            if not output_path:
-                return [TextContent(
-                    type="text",
-                    text="Error: output_path is required"
-                )]
-            result = await r.start_recording(output_path)
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
+    return _frame_content(
+        image_data, image_format,
+        f"Screenshot captured via {backend_used}"
+    )
 
-        elif name == "device_stop_recording":
-            result = await r.stop_recording()
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
 
-        elif name == "device_recording_status":
-            status = r.get_recording_status()
-            return [TextContent(
-                type="text",
-                text=json.dumps(status, indent=2)
-            )]
+async def _handle_get_frame(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_get_frame: buffered frame at an offset from latest."""
+    offset = arguments.get("offset", 0)
+    device = arguments.get("device")
+    fmt = arguments.get("format", "jpeg")
+    max_dim = arguments.get("max_dim")
+    image_data, backend_used, image_format = await r.get_frame_at_offset(offset, device, fmt, max_dim)
+
+    return _frame_content(
+        image_data, image_format,
+        f"Frame at offset {offset} captured via {backend_used}"
+    )
+
+
+async def _handle_list(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_list: connected devices."""
+    devices = await r.list_devices()
+    return [TextContent(
+        type="text",
+        text=json.dumps(devices, indent=2)
+    )]
+
+
+async def _handle_screen_size(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_screen_size: screen width and height."""
+    device = arguments.get("device")
+    width, height = await r.get_screen_size(device)
+    return [TextContent(
+        type="text",
+        text=f"Screen size: {width}x{height}"
+    )]
+
+
+async def _handle_backend_status(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_backend_status: backend and frame buffer state."""
+    status = r.get_backend_status()
+    return [TextContent(
+        type="text",
+        text=json.dumps(status, indent=2)
+    )]
+
+
+async def _handle_start_recording(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_start_recording: start a scrcpy recording."""
+    output_path = arguments.get("output_path")
+    if not output_path:
+        return [TextContent(
+            type="text",
+            text="Error: output_path is required"
+        )]
+    result = await r.start_recording(output_path)
+    return [TextContent(
+        type="text",
+        text=json.dumps(result, indent=2)
+    )]
 
-        else:
-            return [TextContent(
-                type="text",
-                text=f"Unknown tool: {name}"
-            )]
 
+async def _handle_stop_recording(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_stop_recording: stop the recording and report the file."""
+    result = await r.stop_recording()
+    return [TextContent(
+        type="text",
+        text=json.dumps(result, indent=2)
+    )]
+
+
+async def _handle_recording_status(r: DeviceRouter, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """device_recording_status: current recording state."""
+    status = r.get_recording_status()
+    return [TextContent(
+        type="text",
+        text=json.dumps(status, indent=2)
+    )]
+
+
+# Tool name -> handler coroutine taking (router, arguments)
+_HANDLERS: dict[str, Callable[[DeviceRouter, dict[str, Any]], Awaitable[list[TextContent | ImageContent]]]] = {
+    "device_screenshot": _handle_screenshot,
+    "device_get_frame": _handle_get_frame,
+    "device_list": _handle_list,
+    "device_screen_size": _handle_screen_size,
+    "device_backend_status": _handle_backend_status,
+    "device_start_recording": _handle_start_recording,
+    "device_stop_recording": _handle_stop_recording,
+    "device_recording_status": _handle_recording_status,
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """Handle tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(
+            type="text",
+            text=f"Unknown tool: {name}"
+        )]
+
+    try:
+        return await handler(get_router(), arguments)
     except Exception as e:
         logger.exception(f"Error in {name}")
         return [TextContent(
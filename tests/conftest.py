@@ -0,0 +1,35 @@
+"""Shared fixtures for ScrcpyBackend tests (no device or MYScrcpy needed)."""
+
+import time
+
+import numpy
+import pytest
+
+from screen_buffer_mcp.backends import scrcpy
+from screen_buffer_mcp.backends.scrcpy import ScrcpyBackend
+
+SHAPE = (4, 6, 3)
+
+
+@pytest.fixture(autouse=True)
+def numpy_module(monkeypatch):
+    """numpy is imported alongside MYScrcpy; provide it when MYScrcpy is absent."""
+    if scrcpy.np is None:
+        monkeypatch.setattr(scrcpy, "np", numpy)
+
+
+@pytest.fixture
+def backend():
+    return ScrcpyBackend()
+
+
+def make_frame(value: int, shape: tuple[int, ...] = SHAPE) -> numpy.ndarray:
+    """A frame whose every pixel is value, so reads can be identified."""
+    return numpy.full(shape, value, dtype=numpy.uint8)
+
+
+def store_frames(backend: ScrcpyBackend, count: int, start: int = 0) -> None:
+    """Store frames start..start+count-1, 10ms apart."""
+    base = time.monotonic_ns() - 10_000_000_000
+    for i in range(start, start + count):
+        backend._store_frame(make_frame(i), base + i * 10_000_000)
@@ -0,0 +1,169 @@
+"""Tests for the ScrcpyBackend frame ring (no device or MYScrcpy needed)."""
+
+import io
+import time
+from collections import OrderedDict
+
+import numpy
+import pytest
+
+from screen_buffer_mcp.backends import scrcpy
+from screen_buffer_mcp.backends.scrcpy import (
+    FRAME_BUFFER_SIZE,
+    RING_SLOTS,
+    ScrcpyBackend,
+)
+
+from conftest import SHAPE, make_frame, store_frames
+
+
+async def read_frame(backend: ScrcpyBackend, offset: int) -> numpy.ndarray:
+    """Read the frame at offset as raw pixels."""
+    return numpy.load(io.BytesIO(await backend._encode_buffered(offset, "raw")))
+
+
+async def read_value(backend: ScrcpyBackend, offset: int) -> int:
+    return int((await read_frame(backend, offset))[0, 0, 0])
+
+
+@pytest.mark.asyncio
+async def test_partial_buffer_offsets(backend):
+    store_frames(backend, 3)
+
+    assert backend._buffered_count() == 3
+    assert await read_value(backend, 0) == 2
+    assert await read_value(backend, 2) == 0
+
+
+@pytest.mark.asyncio
+async def test_wraparound_keeps_newest_frames(backend):
+    total = RING_SLOTS * 2 + 3
+    store_frames(backend, total)
+
+    assert backend._buffered_count() == FRAME_BUFFER_SIZE
+    for offset in range(FRAME_BUFFER_SIZE):
+        assert await read_value(backend, offset) == total - 1 - offset
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offset", [FRAME_BUFFER_SIZE, FRAME_BUFFER_SIZE + 5, 1000])
+async def test_large_offset_clamps_to_oldest(backend, offset):
+    total = RING_SLOTS + 4
+    store_frames(backend, total)
+
+    assert await read_value(backend, offset) == total - FRAME_BUFFER_SIZE
+
+
+@pytest.mark.asyncio
+async def test_large_offset_clamps_in_partial_buffer(backend):
+    store_frames(backend, 3)
+
+    assert await read_value(backend, 5) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offset", [-1, -3, -20])
+async def test_negative_offset_returns_latest(backend, offset):
+    store_frames(backend, 3)
+
+    assert await read_value(backend, offset) == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_buffer_raises(backend):
+    with pytest.raises(RuntimeError, match="No frames"):
+        await backend._encode_buffered(0, "raw")
+
+
+@pytest.mark.asyncio
+async def test_shape_change_reallocates_ring(backend):
+    store_frames(backend, 5)
+    rotated = (SHAPE[1], SHAPE[0], SHAPE[2])
+    backend._store_frame(make_frame(99, rotated), time.monotonic_ns())
+
+    # Older frames had the previous shape and are dropped
+    assert backend._buffered_count() == 1
+    assert backend._frame_count == 1
+    frame = await read_frame(backend, 3)
+    assert frame.shape == rotated
+    assert frame[0, 0, 0] == 99
+
+
+@pytest.mark.asyncio
+async def test_read_during_reallocation(backend):
+    store_frames(backend, 5)
+    rotated = (SHAPE[1], SHAPE[0], SHAPE[2])
+    backend._store_frame(make_frame(99, rotated), time.monotonic_ns())
+    # Roll back to the moment the new ring was published but _seq not yet bumped
+    backend._seq -= 1
+
+    assert backend._buffered_count() == 1
+    frame = await read_frame(backend, 0)
+    assert frame.shape == rotated
+    assert frame[0, 0, 0] == 99
+
+
+@pytest.mark.asyncio
+async def test_raw_frames_not_cached(backend):
+    store_frames(backend, 2)
+
+    await backend._encode_buffered(0, "raw")
+
+    assert len(backend._encoded_frames) == 0
+
+
+class LappingCache(OrderedDict):
+    """Encode cache that simulates the producer lapping the reader mid-read."""
+
+    def __init__(self, backend: ScrcpyBackend, laps: int):
+        super().__init__()
+        self.backend = backend
+        self.laps = laps
+
+    def get(self, key, default=None):
+        if self.laps:
+            self.laps -= 1
+            store_frames(self.backend, RING_SLOTS, start=self.backend._seq)
+        return super().get(key, default)
+
+
+@pytest.mark.asyncio
+async def test_read_retries_after_being_lapped(backend):
+    store_frames(backend, 3)
+    backend._encoded_frames = LappingCache(backend, laps=1)
+
+    # The retry reads the newest frame written during the lap
+    assert await read_value(backend, 0) == 3 + RING_SLOTS - 1
+
+
+@pytest.mark.asyncio
+async def test_read_gives_up_when_always_lapped(backend):
+    store_frames(backend, 3)
+    backend._encoded_frames = LappingCache(backend, laps=scrcpy.RING_READ_RETRIES)
+
+    with pytest.raises(RuntimeError, match="overrun"):
+        await backend._encode_buffered(0, "raw")
+
+
+def test_buffer_info_empty(backend):
+    info = backend.get_buffer_info()
+
+    assert info == {
+        "frame_count": 0,
+        "buffer_size": FRAME_BUFFER_SIZE,
+        "oldest_frame_age_ms": None,
+        "newest_frame_age_ms": None,
+    }
+
+
+def test_buffer_info_stats(backend):
+    store_frames(backend, FRAME_BUFFER_SIZE + 5)
+
+    info = backend.get_buffer_info()
+
+    assert info["frame_count"] == FRAME_BUFFER_SIZE
+    assert info["buffer_size"] == FRAME_BUFFER_SIZE
+    # Ten buffered frames 10ms apart: oldest is 90ms older than newest
+    spread = info["oldest_frame_age_ms"] - info["newest_frame_age_ms"]
+    assert 89 <= spread <= 91
+    assert info["newest_frame_age_ms"] >= 0
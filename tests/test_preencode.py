@@ -0,0 +1,116 @@
+"""Tests for the producer-side JPEG pre-encode cache."""
+
+import time
+
+import pytest
+
+from screen_buffer_mcp.backends import scrcpy
+from screen_buffer_mcp.backends.scrcpy import PREENCODE_IDLE_TIMEOUT, ScrcpyBackend
+
+from conftest import make_frame
+
+ENCODE_FPS = 5
+
+
+@pytest.fixture
+def encodes(monkeypatch):
+    """Replace the encoder with one that records (value, fmt) per call."""
+    calls = []
+
+    def fake_encode(frame, fmt="jpeg"):
+        calls.append((int(frame[0, 0, 0]), fmt))
+        return f"{fmt}:{frame[0, 0, 0]}:{frame.shape[1]}".encode()
+
+    monkeypatch.setattr(scrcpy, "_encode_frame", fake_encode)
+    return calls
+
+
+@pytest.fixture
+def backend():
+    backend = ScrcpyBackend(encode_fps=ENCODE_FPS)
+    # screenshot() only checks that a session exists
+    backend._connected = True
+    backend._session = object()
+    # A client is actively requesting JPEG screenshots
+    backend._last_jpeg_request = time.monotonic()
+    return backend
+
+
+def buffer_frame(backend: ScrcpyBackend, value: int) -> None:
+    """Store a frame and pre-encode as one polling-loop tick would."""
+    timestamp = time.monotonic_ns()
+    frame = make_frame(value)
+    backend._store_frame(frame, timestamp)
+    backend._jpeg_pending = (frame, timestamp)
+    backend._preencode()
+
+
+def end_throttle_window(backend: ScrcpyBackend) -> None:
+    backend._last_jpeg_encode -= 1_000_000_000 // ENCODE_FPS + 1
+
+
+@pytest.mark.asyncio
+async def test_serves_cached_jpeg_of_newest_frame(backend, encodes):
+    buffer_frame(backend, 1)
+
+    assert await backend.screenshot() == b"jpeg:1:6"
+    assert encodes == [(1, "jpeg")]
+
+
+@pytest.mark.asyncio
+async def test_throttled_last_frame_not_served_stale(backend, encodes):
+    buffer_frame(backend, 1)
+    # Arrives inside the throttle window, then the screen goes still
+    buffer_frame(backend, 2)
+    assert backend._latest_jpeg[1] == b"jpeg:1:6"
+
+    # The cached bytes are of an older frame - encode the newest instead
+    assert await backend.screenshot() == b"jpeg:2:6"
+
+
+@pytest.mark.asyncio
+async def test_pending_frame_encoded_after_throttle_window(backend, encodes):
+    buffer_frame(backend, 1)
+    buffer_frame(backend, 2)
+
+    # Later polling ticks with no new frame
+    backend._preencode()
+    assert backend._latest_jpeg[1] == b"jpeg:1:6"
+    end_throttle_window(backend)
+    backend._preencode()
+
+    assert backend._latest_jpeg[1] == b"jpeg:2:6"
+    assert backend._jpeg_pending is None
+    encodes.clear()
+    assert await backend.screenshot() == b"jpeg:2:6"
+    assert encodes == []
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_drops_cache(backend, encodes):
+    buffer_frame(backend, 1)
+    backend._last_jpeg_request = time.monotonic() - PREENCODE_IDLE_TIMEOUT - 1
+    buffer_frame(backend, 2)
+
+    assert backend._latest_jpeg is None
+    # The idle frame stays pending and is encoded once requests resume
+    assert backend._jpeg_pending is not None
+    encodes.clear()
+    assert await backend.screenshot() == b"jpeg:2:6"
+    backend._preencode()
+    assert backend._latest_jpeg[1] == b"jpeg:2:6"
+
+
+@pytest.mark.asyncio
+async def test_png_bypasses_cache(backend, encodes):
+    buffer_frame(backend, 1)
+
+    assert await backend.screenshot("png") == b"png:1:6"
+    assert encodes[-1] == (1, "png")
+
+
+@pytest.mark.asyncio
+async def test_max_dim_bypasses_cache(backend, encodes):
+    buffer_frame(backend, 1)
+
+    assert await backend.screenshot(max_dim=3) == b"jpeg:1:3"